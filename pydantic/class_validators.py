@@ -5,6 +5,7 @@ from inspect import Signature, signature
 from itertools import chain
 from types import FunctionType
 from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Type
+from weakref import WeakValueDictionary
 
 from .errors import ConfigError
 from .typing import AnyCallable
@@ -148,7 +149,16 @@ def make_generic_validator(validator: AnyCallable) -> 'ValidatorCallable':
 
     It's done like this so validators don't all need **kwargs in their signature, eg. any combination of
     the arguments "values", "fields" and/or "config" are permitted.
+
+    The generic function depends only on the validator, so it's cached and validators shared by many fields
+    (eg. int_validator) are only inspected once.
     """
+    try:
+        return _GENERIC_VALIDATOR_CACHE[validator]
+    except (KeyError, TypeError):
+        # TypeError if the validator isn't hashable
+        pass
+
     sig = signature(validator)
     args = list(sig.parameters.keys())
     first_arg = args.pop(0)
@@ -159,10 +169,20 @@ def make_generic_validator(validator: AnyCallable) -> 'ValidatorCallable':
         )
     elif first_arg == 'cls':
         # assume the second argument is value
-        return wraps(validator)(_generic_validator_cls(validator, sig, set(args[1:])))
+        generic_validator = wraps(validator)(_generic_validator_cls(validator, sig, set(args[1:])))
     else:
         # assume the first argument was value which has already been removed
-        return wraps(validator)(_generic_validator_basic(validator, sig, set(args)))
+        generic_validator = wraps(validator)(_generic_validator_basic(validator, sig, set(args)))
+
+    try:
+        _GENERIC_VALIDATOR_CACHE[validator] = generic_validator
+    except TypeError:
+        pass
+    return generic_validator
+
+
+# generic validators are only kept while used by a field, the validator itself is kept alive by its generic validator
+_GENERIC_VALIDATOR_CACHE: 'WeakValueDictionary[AnyCallable, ValidatorCallable]' = WeakValueDictionary()
 
 
 all_kwargs = {'values', 'field', 'config'}
@@ -25,7 +25,21 @@ from .errors import NoneIsNotAllowedError
 from .types import Json, JsonWrapper
 from .typing import AnyCallable, AnyType, Callable, ForwardRef, display_as_type, is_literal_type, literal_values
 from .utils import lenient_issubclass, sequence_like
-from .validators import constant_validator, dict_validator, find_validators, validate_json
+from .validators import (
+    bool_validator,
+    bytes_validator,
+    constant_validator,
+    dict_validator,
+    find_validators,
+    float_validator,
+    int_validator,
+    is_noop_validator,
+    str_validator,
+    strict_float_validator,
+    strict_int_validator,
+    strict_str_validator,
+    validate_json,
+)
 
 try:
     from typing_extensions import Literal
@@ -57,6 +71,22 @@ SHAPE_TUPLE_ELLIPSIS = 6
 SHAPE_SEQUENCE = 7
 SHAPE_FROZENSET = 8
 
+# exact types accepted by sequence_like(), checked first to avoid the call in the common case
+SEQUENCE_TYPES = list, tuple, set, frozenset
+
+# validators which return values of exactly the paired type unchanged, a field whose only validator is one of these
+# lets containers skip validating items of that type, see Field._validate_sequence_like
+PASSTHROUGH_VALIDATORS = (
+    (int_validator, int),
+    (strict_int_validator, int),
+    (float_validator, float),
+    (strict_float_validator, float),
+    (str_validator, str),
+    (strict_str_validator, str),
+    (bytes_validator, bytes),
+    (bool_validator, bool),
+)
+
 
 class Field:
     __slots__ = (
@@ -78,6 +108,12 @@ class Field:
         'shape',
         'class_validators',
         'parse_json',
+        '_singleton_validators',
+        '_passthrough_type',
+        '_each_item_validators',
+        '_is_complex',
+        '_union_validators',
+        '_shape_validator',
     )
 
     def __init__(
@@ -105,13 +141,20 @@ class Field:
 
         self.allow_none: bool = False
         self.validate_always: bool = False
-        self.sub_fields: Optional[List[Field]] = None
+        self.sub_fields: Optional[Sequence[Field]] = None
         self.key_field: Optional[Field] = None
         self.validators: 'ValidatorsList' = []
         self.pre_validators: Optional['ValidatorsList'] = None
         self.post_validators: Optional['ValidatorsList'] = None
         self.parse_json: bool = False
         self.shape: int = SHAPE_SINGLETON
+        self._singleton_validators: Optional['ValidatorsList'] = None
+        self._passthrough_type: Optional[type] = None
+        self._each_item_validators: Dict[str, Validator] = {}
+        self._is_complex: bool = False
+        self._union_validators: Optional[Tuple[Tuple[Field, 'ValidatorsList'], ...]] = None
+        # replaced in _populate_validators(), but a field left waiting on a ForwardRef never gets there
+        self._shape_validator: AnyCallable = self.__class__._validate_singleton
         self.prepare()
 
     @classmethod
@@ -133,7 +176,7 @@ class Field:
         else:
             schema = Schema(value, **schema_from_config)  # type: ignore
         schema.alias = schema.alias or schema_from_config.get('alias')
-        required = value == Required
+        required = value is Required
         annotation = get_annotation_from_schema(annotation, schema)
         return cls(
             name=name,
@@ -153,6 +196,11 @@ class Field:
             self.schema = cast('Schema', self.schema)
             self.schema.alias = self.schema.alias or schema_from_config.get('alias')
             self.alias = cast(str, self.schema.alias)
+        if type(self.type_) != ForwardRef and hasattr(self.type_, '__get_validators__'):
+            # validators yielded by the type itself read the config when called, so whether is_noop_validator leaves
+            # them out has to follow the new config; validators from find_validators keep the config they were
+            # chosen with, as do sub fields
+            self._populate_validators()
 
     @property
     def alt_alias(self) -> bool:
@@ -177,9 +225,22 @@ class Field:
         if not self.required and self.default is None:
             self.allow_none = True
 
+        # passed on to every sub field, see _create_sub_type
+        self._each_item_validators = {k: v for k, v in self.class_validators.items() if v.each_item}
         self._type_analysis()
+        if self.sub_fields is not None:
+            # sub_fields is fixed from here on and iterated for every value validated, a tuple is cheaper to loop over
+            self.sub_fields = tuple(self.sub_fields)
         self._populate_validators()
 
+        from .main import BaseModel  # noqa: F811
+
+        self._is_complex = (
+            self.shape != SHAPE_SINGLETON
+            or lenient_issubclass(self.type_, (BaseModel, list, set, dict))
+            or hasattr(self.type_, '__pydantic_model__')  # pydantic dataclass
+        )
+
     def _type_analysis(self) -> None:  # noqa: C901 (ignore complexity)
         # typing interface is horrible, we have to do some ugly checks
         if lenient_issubclass(self.type_, JsonWrapper):
@@ -223,13 +284,13 @@ class Field:
 
         if issubclass(origin, Tuple):  # type: ignore
             self.shape = SHAPE_TUPLE
-            self.sub_fields = []
+            self.sub_fields = sub_fields = []
             for i, t in enumerate(self.type_.__args__):  # type: ignore
                 if t is Ellipsis:
                     self.type_ = self.type_.__args__[0]  # type: ignore
                     self.shape = SHAPE_TUPLE_ELLIPSIS
                     return
-                self.sub_fields.append(self._create_sub_type(t, f'{self.name}_{i}'))
+                sub_fields.append(self._create_sub_type(t, f'{self.name}_{i}'))
             return
 
         if issubclass(origin, List):
@@ -272,12 +333,17 @@ class Field:
         return self.__class__(
             type_=type_,
             name=name,
-            class_validators=None if for_keys else {k: v for k, v in self.class_validators.items() if v.each_item},
+            # copied as sub fields may add validators of their own
+            class_validators=None if for_keys else self._each_item_validators.copy(),
             model_config=self.model_config,
         )
 
     def _populate_validators(self) -> None:
+        # the shape is fixed from here on, so validate() can call the method for it without an if/elif chain; it's
+        # looked up on the class (unbound, to avoid a reference cycle) so subclasses overriding the method are respected
+        self._shape_validator = getattr(self.__class__, self._shape_validator_names[self.shape])  # type: ignore
         class_validators_ = self.class_validators.values()
+        passthrough_type = None
         if not self.sub_fields:
             get_validators = getattr(self.type_, '__get_validators__', None)
             v_funcs = (
@@ -285,7 +351,10 @@ class Field:
                 *(get_validators() if get_validators else list(find_validators(self.type_, self.model_config))),
                 *[v.func for v in class_validators_ if v.each_item and not v.pre],
             )
+            v_funcs = tuple(f for f in v_funcs if f and not is_noop_validator(f, self, self.model_config))
             self.validators = self._prep_vals(v_funcs)
+            if len(v_funcs) == 1:
+                passthrough_type = next((t for f, t in PASSTHROUGH_VALIDATORS if f is v_funcs[0]), None)
 
         # Add const validator
         self.pre_validators = []
@@ -303,6 +372,23 @@ class Field:
         self.pre_validators = self.pre_validators or None
         self.post_validators = self.post_validators or None
 
+        # the flags above are fixed from here on, fields which need none of the generic machinery in validate()
+        # get their validators set here so validate() can jump straight to them
+        simple = self.shape == SHAPE_SINGLETON and not self.sub_fields
+        if simple and not self.pre_validators and not self.post_validators:
+            self._singleton_validators = self.validators
+            self._passthrough_type = passthrough_type
+        else:
+            self._singleton_validators = None
+            self._passthrough_type = None
+
+        # likewise a Union of such fields can run each member's validators itself, see _validate_singleton
+        sub_fields = self.sub_fields
+        self._union_validators = None
+        if self.shape == SHAPE_SINGLETON and sub_fields:
+            if all(f._singleton_validators is not None for f in sub_fields):
+                self._union_validators = tuple((f, f._singleton_validators) for f in sub_fields)  # type: ignore
+
     @staticmethod
     def _prep_vals(v_funcs: Iterable[AnyCallable]) -> 'ValidatorsList':
         return [make_generic_validator(f) for f in v_funcs if f]
@@ -311,33 +397,37 @@ class Field:
         self, v: Any, values: Dict[str, Any], *, loc: 'LocStr', cls: Optional['ModelOrDc'] = None
     ) -> 'ValidateReturn':
 
+        singleton_validators = self._singleton_validators
+        if singleton_validators is not None and v is not None:
+            # same as _apply_validators() but inlined as this is by far the most common case
+            config = self.model_config
+            for validator in singleton_validators:
+                try:
+                    v = validator(cls, v, values, self, config)
+                except (ValueError, TypeError, AssertionError) as exc:
+                    return v, ErrorWrapper(exc, loc)
+            return v, None
+
         errors: Optional['ErrorList']
-        if self.pre_validators:
-            v, errors = self._apply_validators(v, values, loc, cls, self.pre_validators)
+        pre_validators, post_validators = self.pre_validators, self.post_validators
+        if pre_validators:
+            v, errors = self._apply_validators(v, values, loc, cls, pre_validators)
             if errors:
                 return v, errors
 
         if v is None:
             if self.allow_none:
-                if self.post_validators:
-                    return self._apply_validators(v, values, loc, cls, self.post_validators)
+                if post_validators:
+                    return self._apply_validators(v, values, loc, cls, post_validators)
                 else:
                     return None, None
             else:
                 return v, ErrorWrapper(NoneIsNotAllowedError(), loc)
 
-        if self.shape == SHAPE_SINGLETON:
-            v, errors = self._validate_singleton(v, values, loc, cls)
-        elif self.shape == SHAPE_MAPPING:
-            v, errors = self._validate_mapping(v, values, loc, cls)
-        elif self.shape == SHAPE_TUPLE:
-            v, errors = self._validate_tuple(v, values, loc, cls)
-        else:
-            #  sequence, list, set, generator, tuple with ellipsis, frozen set
-            v, errors = self._validate_sequence_like(v, values, loc, cls)
+        v, errors = self._shape_validator(self, v, values, loc, cls)
 
-        if not errors and self.post_validators:
-            v, errors = self._apply_validators(v, values, loc, cls, self.post_validators)
+        if not errors and post_validators:
+            v, errors = self._apply_validators(v, values, loc, cls, post_validators)
         return v, errors
 
     def _validate_sequence_like(  # noqa: C901 (ignore complexity)
@@ -348,41 +438,67 @@ class Field:
         Note that large if-else blocks are necessary to enable Cython
         optimization, which is why we disable the complexity check above.
         """
-        if not sequence_like(v):
+        shape = self.shape
+        if type(v) not in SEQUENCE_TYPES and not sequence_like(v):
             e: errors_.PydanticTypeError
-            if self.shape == SHAPE_LIST:
+            if shape == SHAPE_LIST:
                 e = errors_.ListError()
-            elif self.shape == SHAPE_SET:
+            elif shape == SHAPE_SET:
                 e = errors_.SetError()
-            elif self.shape == SHAPE_FROZENSET:
+            elif shape == SHAPE_FROZENSET:
                 e = errors_.FrozenSetError()
             else:
                 e = errors_.SequenceError()
             return v, ErrorWrapper(e, loc)
 
         loc = loc if isinstance(loc, tuple) else (loc,)
-        result = []
-        errors: List[ErrorList] = []
-        for i, v_ in enumerate(v):
-            v_loc = *loc, i
-            r, ee = self._validate_singleton(v_, values, v_loc, cls)
-            if ee:
-                errors.append(ee)
+        set_shape = shape == SHAPE_SET or shape == SHAPE_FROZENSET
+        apply_validators, validators, item_type = self._item_validators()
+        result: Union[List[Any], Set[Any]]
+        if item_type is not None and type(v) in SEQUENCE_TYPES and all(type(x) is item_type for x in v):
+            # every item is exactly the type the item validators return unchanged (eg. a list of ints for List[int]),
+            # so skip them and copy the items in one go, the check stops at the first item of another type
+            result = set(v) if set_shape else list(v)
+        else:
+            # lists are allocated up front and filled by index when the length is known, result is discarded on errors
+            # so gaps left by invalid items don't matter
+            sized_list = not set_shape and type(v) in SEQUENCE_TYPES
+            if set_shape:
+                # build sets directly rather than going via an intermediate list
+                result = set()
+                add_result = result.add
+            elif sized_list:
+                result = [None] * len(v)
             else:
-                result.append(r)
+                result = []
+                add_result = result.append  # type: ignore
+            errors: List[ErrorList] = []
+            validate_singleton = self._validate_singleton
+            for i, v_ in enumerate(v):
+                if validators is not None and v_ is not None:
+                    # the item's loc is only used for errors, so only build it when there is one
+                    r, ee = apply_validators(v_, values, loc, cls, validators)  # type: ignore
+                    if ee:
+                        ee = ErrorWrapper(ee.exc, (*loc, i))
+                else:
+                    r, ee = validate_singleton(v_, values, (*loc, i), cls)
+                if ee:
+                    errors.append(ee)
+                elif sized_list:
+                    result[i] = r  # type: ignore
+                else:
+                    add_result(r)
 
-        if errors:
-            return v, errors
+            if errors:
+                return v, errors
 
         converted: Union[List[Any], Set[Any], FrozenSet[Any], Tuple[Any, ...], Iterator[Any]] = result
 
-        if self.shape == SHAPE_SET:
-            converted = set(result)
-        elif self.shape == SHAPE_FROZENSET:
+        if shape == SHAPE_FROZENSET:
             converted = frozenset(result)
-        elif self.shape == SHAPE_TUPLE_ELLIPSIS:
+        elif shape == SHAPE_TUPLE_ELLIPSIS:
             converted = tuple(result)
-        elif self.shape == SHAPE_SEQUENCE:
+        elif shape == SHAPE_SEQUENCE:
             if isinstance(v, tuple):
                 converted = tuple(result)
             elif isinstance(v, set):
@@ -395,7 +511,7 @@ class Field:
         self, v: Any, values: Dict[str, Any], loc: 'LocStr', cls: Optional['ModelOrDc']
     ) -> 'ValidateReturn':
         e: Optional[Exception] = None
-        if not sequence_like(v):
+        if type(v) not in SEQUENCE_TYPES and not sequence_like(v):
             e = errors_.TupleError()
         else:
             actual_length, expected_length = len(v), len(self.sub_fields)  # type: ignore
@@ -424,22 +540,45 @@ class Field:
     def _validate_mapping(
         self, v: Any, values: Dict[str, Any], loc: 'LocStr', cls: Optional['ModelOrDc']
     ) -> 'ValidateReturn':
-        try:
-            v_iter = dict_validator(v)
-        except TypeError as exc:
-            return v, ErrorWrapper(exc, loc)
+        if type(v) is dict:
+            # skip the call for the common case, dict_validator would return v unchanged
+            v_iter = v
+        else:
+            try:
+                v_iter = dict_validator(v)
+            except TypeError as exc:
+                return v, ErrorWrapper(exc, loc)
+
+        apply_validators, validators, item_type = self._item_validators()
+        key_type = self.key_field._passthrough_type  # type: ignore
+        if (
+            item_type is not None
+            and key_type is not None
+            and all(type(k) is key_type for k in v_iter)
+            and all(type(x) is item_type for x in v_iter.values())
+        ):
+            # as in _validate_sequence_like, keys and values are all of the exact types their validators would return
+            # unchanged (eg. Dict[str, int]), so skip them and copy the mapping in one go
+            return dict(v_iter), None
 
         loc = loc if isinstance(loc, tuple) else (loc,)
         result, errors = {}, []
+        validate_key = self.key_field.validate  # type: ignore
+        validate_singleton = self._validate_singleton
+        key_loc = *loc, '__key__'
         for k, v_ in v_iter.items():
-            v_loc = *loc, '__key__'
-            key_result, key_errors = self.key_field.validate(k, values, loc=v_loc, cls=cls)  # type: ignore
+            key_result, key_errors = validate_key(k, values, loc=key_loc, cls=cls)
             if key_errors:
                 errors.append(key_errors)
                 continue
 
-            v_loc = *loc, k
-            value_result, value_errors = self._validate_singleton(v_, values, v_loc, cls)
+            if validators is not None and v_ is not None:
+                # the value's loc is only used for errors, so only build it when there is one
+                value_result, value_errors = apply_validators(v_, values, loc, cls, validators)  # type: ignore
+                if value_errors:
+                    value_errors = ErrorWrapper(value_errors.exc, (*loc, k))
+            else:
+                value_result, value_errors = validate_singleton(v_, values, (*loc, k), cls)
             if value_errors:
                 errors.append(value_errors)
                 continue
@@ -450,15 +589,52 @@ class Field:
         else:
             return result, None
 
+    def _item_validators(self) -> Tuple[Optional[AnyCallable], Optional['ValidatorsList'], Optional[type]]:
+        """
+        Container items are validated by _validate_singleton(), for a single plain sub field (eg. List[int]) that
+        ends up at the sub field's validators via validate()'s fast path, so return them to be called directly
+        along with the sub field's passthrough type.
+        """
+        sub_fields = self.sub_fields
+        if sub_fields and len(sub_fields) == 1:
+            item_field = sub_fields[0]
+            if item_field._singleton_validators is not None:
+                return item_field._apply_validators, item_field._singleton_validators, item_field._passthrough_type
+        return None, None, None
+
     def _validate_singleton(
         self, v: Any, values: Dict[str, Any], loc: 'LocStr', cls: Optional['ModelOrDc']
     ) -> 'ValidateReturn':
-        if self.sub_fields:
-            errors = []
-            for field in self.sub_fields:
+        sub_fields = self.sub_fields
+        if sub_fields:
+            # sub_fields are tried in order and the first to succeed wins (see test_union_priority), so they can't be
+            # looked up by type(v); the errors list is only created once a sub field has failed
+            errors: Optional[List[ErrorList]] = None
+            union_validators = self._union_validators
+            if union_validators is not None and v is not None:
+                # every member is a plain field, run their validators here rather than going through validate()
+                for field, validators in union_validators:
+                    config = field.model_config
+                    value = v
+                    try:
+                        for validator in validators:
+                            value = validator(cls, value, values, field, config)
+                    except (ValueError, TypeError, AssertionError) as exc:
+                        if errors is None:
+                            errors = [ErrorWrapper(exc, loc)]
+                        else:
+                            errors.append(ErrorWrapper(exc, loc))
+                    else:
+                        return value, None
+                return v, errors
+
+            for field in sub_fields:
                 value, error = field.validate(v, values, loc=loc, cls=cls)
                 if error:
-                    errors.append(error)
+                    if errors is None:
+                        errors = [error]
+                    else:
+                        errors.append(error)
                 else:
                     return value, None
             return v, errors
@@ -468,13 +644,27 @@ class Field:
     def _apply_validators(
         self, v: Any, values: Dict[str, Any], loc: 'LocStr', cls: Optional['ModelOrDc'], validators: 'ValidatorsList'
     ) -> 'ValidateReturn':
+        config = self.model_config
         for validator in validators:
             try:
-                v = validator(cls, v, values, self, self.model_config)
+                v = validator(cls, v, values, self, config)
             except (ValueError, TypeError, AssertionError) as exc:
                 return v, ErrorWrapper(exc, loc)
         return v, None
 
+    # name of the validation method for each shape, indexed by the SHAPE_* constants above, see _populate_validators
+    _shape_validator_names = (
+        None,
+        '_validate_singleton',  # SHAPE_SINGLETON
+        '_validate_sequence_like',  # SHAPE_LIST
+        '_validate_sequence_like',  # SHAPE_SET
+        '_validate_mapping',  # SHAPE_MAPPING
+        '_validate_tuple',  # SHAPE_TUPLE
+        '_validate_sequence_like',  # SHAPE_TUPLE_ELLIPSIS
+        '_validate_sequence_like',  # SHAPE_SEQUENCE
+        '_validate_sequence_like',  # SHAPE_FROZENSET
+    )
+
     def include_in_schema(self) -> bool:
         """
         False if this is a simple field just allowing None as used in Unions/Optional.
@@ -484,14 +674,10 @@ class Field:
     def is_complex(self) -> bool:
         """
         Whether the field is "complex" eg. env variables should be parsed as JSON.
-        """
-        from .main import BaseModel  # noqa: F811
 
-        return (
-            self.shape != SHAPE_SINGLETON
-            or lenient_issubclass(self.type_, (BaseModel, list, set, dict))
-            or hasattr(self.type_, '__pydantic_model__')  # pydantic dataclass
-        )
+        This only depends on the type so is worked out once in prepare().
+        """
+        return self._is_complex
 
     def __repr__(self) -> str:
         return f'<Field({self})>'
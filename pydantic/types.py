@@ -1,9 +1,26 @@
 import re
+from collections import OrderedDict
 from decimal import Decimal
 from enum import Enum
+from inspect import isgenerator
 from pathlib import Path
+from stat import S_ISDIR, S_ISREG
 from types import new_class
-from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, List, Optional, Pattern, Type, TypeVar, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 from uuid import UUID
 
 from . import errors
@@ -18,7 +35,6 @@ from .validators import (
     int_validator,
     number_multiple_validator,
     number_size_validator,
-    path_exists_validator,
     path_validator,
     str_validator,
     strict_float_validator,
@@ -86,6 +102,37 @@ if TYPE_CHECKING:  # pragma: no cover
 
     ModelOrDc = Type[Union['BaseModel', 'DataclassType']]
 
+# least recently used classes are dropped beyond this, so eg. constraints built per request can't grow it forever
+_CONSTRAINED_TYPES_CACHE_SIZE = 1024
+_constrained_types_cache: 'OrderedDict[Tuple[Any, ...], Type[Any]]' = OrderedDict()
+
+
+def _constrained_type(name: str, base: Type[Any], namespace: Dict[str, Any]) -> Any:
+    """
+    Create a subclass of base with the given constraints, classes are cached so the same constraints give the
+    same class. Values are keyed along with their type since eg. 1, 1.0 and True are equal but aren't the same
+    constraint.
+    """
+    key = (base, *((k, v.__class__, v) for k, v in namespace.items()))
+    try:
+        cached = _constrained_types_cache[key]
+    except KeyError:
+        cacheable = True
+    except TypeError:
+        # a constraint isn't hashable, eg. an unusual item_type, so this class can't be cached
+        cacheable = False
+    else:
+        _constrained_types_cache.move_to_end(key)
+        return cached
+
+    # We use new_class to be able to deal with Generic types, it would otherwise set __module__ to 'types'
+    created = new_class(name, (base,), {}, lambda ns: ns.update(namespace, __module__=__name__))
+    if cacheable:
+        _constrained_types_cache[key] = created
+        if len(_constrained_types_cache) > _CONSTRAINED_TYPES_CACHE_SIZE:
+            _constrained_types_cache.popitem(last=False)
+    return created
+
 
 class ConstrainedBytes(bytes):
     strip_whitespace = False
@@ -102,7 +149,7 @@ class ConstrainedBytes(bytes):
 def conbytes(*, strip_whitespace: bool = False, min_length: int = None, max_length: int = None) -> Type[bytes]:
     # use kwargs then define conf in a dict to aid with IDE type hinting
     namespace = dict(strip_whitespace=strip_whitespace, min_length=min_length, max_length=max_length)
-    return type('ConstrainedBytesValue', (ConstrainedBytes,), namespace)
+    return _constrained_type('ConstrainedBytesValue', ConstrainedBytes, namespace)
 
 
 T = TypeVar('T')
@@ -112,7 +159,7 @@ T = TypeVar('T')
 class ConstrainedList(list):  # type: ignore
     # Needed for pydantic to detect that this is a list
     __origin__ = list
-    __args__: List[Type[T]]  # type: ignore
+    __args__: Tuple[Type[T]]  # type: ignore
 
     min_items: Optional[int] = None
     max_items: Optional[int] = None
@@ -120,26 +167,43 @@ class ConstrainedList(list):  # type: ignore
 
     @classmethod
     def __get_validators__(cls) -> 'CallableGenerator':
-        yield cls.list_length_validator
+        # list_length_validator does nothing without min_items or max_items, unless a subclass has overridden it,
+        # possibly with a staticmethod which has no __func__
+        length_validator = cls.list_length_validator
+        length_func = getattr(length_validator, '__func__', length_validator)
+        overridden = length_func is not ConstrainedList.list_length_validator.__func__  # type: ignore
+        if cls.min_items is not None or cls.max_items is not None or overridden:
+            yield length_validator
 
     @classmethod
     def list_length_validator(cls, v: 'List[T]', field: 'Field', config: 'BaseConfig') -> 'List[T]':
-        v_len = len(v)
-
-        if cls.min_items is not None and v_len < cls.min_items:
-            raise errors.ListMinLengthError(limit_value=cls.min_items)
-
-        if cls.max_items is not None and v_len > cls.max_items:
-            raise errors.ListMaxLengthError(limit_value=cls.max_items)
+        if v is None:
+            # left to the field, as it is when there's no length check
+            return v
+        try:
+            v_len = len(v)
+        except TypeError:
+            # generators are accepted as lists, anything else without a length isn't a list
+            if not isgenerator(v):
+                raise errors.ListError()
+            v = list(v)
+            v_len = len(v)
+
+        min_items = cls.min_items
+        if min_items is not None and v_len < min_items:
+            raise errors.ListMinLengthError(limit_value=min_items)
+
+        max_items = cls.max_items
+        if max_items is not None and v_len > max_items:
+            raise errors.ListMaxLengthError(limit_value=max_items)
 
         return v
 
 
 def conlist(item_type: Type[T], *, min_items: int = None, max_items: int = None) -> Type[List[T]]:
     # __args__ is needed to conform to typing generics api
-    namespace = {'min_items': min_items, 'max_items': max_items, 'item_type': item_type, '__args__': [item_type]}
-    # We use new_class to be able to deal with Generic types
-    return new_class('ConstrainedListValue', (ConstrainedList,), {}, lambda ns: ns.update(namespace))
+    namespace = {'min_items': min_items, 'max_items': max_items, 'item_type': item_type, '__args__': (item_type,)}
+    return _constrained_type('ConstrainedListValue', ConstrainedList, namespace)
 
 
 class ConstrainedStr(str):
@@ -155,7 +219,16 @@ class ConstrainedStr(str):
         yield strict_str_validator if cls.strict else str_validator
         yield constr_strip_whitespace
         yield constr_length_validator
-        yield cls.validate
+        # a subclass may override validate with a staticmethod, which has no __func__
+        if getattr(cls.validate, '__func__', cls.validate) is not ConstrainedStr.validate.__func__:  # type: ignore
+            yield cls.validate
+        else:
+            # validate() split into just the checks this class needs, bound to its constraints which are fixed
+            if cls.curtail_length:
+                yield _curtail_validator(cls.curtail_length)
+            # ".*" matches any string
+            if cls.regex and cls.regex.pattern.lstrip('^') != '.*':
+                yield _regex_validator(cls.regex)
 
     @classmethod
     def validate(cls, value: str) -> str:
@@ -169,6 +242,35 @@ class ConstrainedStr(str):
         return value
 
 
+def _curtail_validator(curtail_length: int) -> Callable[[str], str]:
+    def curtail_validator(value: str) -> str:
+        return value[:curtail_length] if len(value) > curtail_length else value
+
+    return curtail_validator
+
+
+def _regex_validator(regex: Pattern[str]) -> Callable[[str], str]:
+    pattern = regex.pattern
+    prefix = pattern.lstrip('^')
+    if regex.flags == re.UNICODE and re.escape(prefix) == prefix:
+        # the pattern is just a string to match at the start of the value, no need for the regex engine
+
+        def regex_validator(value: str) -> str:
+            if not value.startswith(prefix):
+                raise errors.StrRegexError(pattern=pattern)
+            return value
+
+    else:
+        match = regex.match
+
+        def regex_validator(value: str) -> str:
+            if not match(value):
+                raise errors.StrRegexError(pattern=pattern)
+            return value
+
+    return regex_validator
+
+
 def constr(
     *,
     strip_whitespace: bool = False,
@@ -187,7 +289,7 @@ def constr(
         curtail_length=curtail_length,
         regex=regex and re.compile(regex),
     )
-    return type('ConstrainedStrValue', (ConstrainedStr,), namespace)
+    return _constrained_type('ConstrainedStrValue', ConstrainedStr, namespace)
 
 
 class StrictStr(ConstrainedStr):
@@ -208,7 +310,8 @@ class StrictBool(int):
         """
         Ensure that we only allow bools.
         """
-        if isinstance(value, bool):
+        # bool can't be subclassed, so True and False are the only bools
+        if value is True or value is False:
             return value
 
         raise errors.StrictBoolError()
@@ -270,7 +373,7 @@ def conint(
 ) -> Type[int]:
     # use kwargs then define conf in a dict to aid with IDE type hinting
     namespace = dict(strict=strict, gt=gt, ge=ge, lt=lt, le=le, multiple_of=multiple_of)
-    return type('ConstrainedIntValue', (ConstrainedInt,), namespace)
+    return _constrained_type('ConstrainedIntValue', ConstrainedInt, namespace)
 
 
 class PositiveInt(ConstrainedInt):
@@ -311,7 +414,7 @@ def confloat(
 ) -> Type[float]:
     # use kwargs then define conf in a dict to aid with IDE type hinting
     namespace = dict(strict=strict, gt=gt, ge=ge, lt=lt, le=le, multiple_of=multiple_of)
-    return type('ConstrainedFloatValue', (ConstrainedFloat,), namespace)
+    return _constrained_type('ConstrainedFloatValue', ConstrainedFloat, namespace)
 
 
 class PositiveFloat(ConstrainedFloat):
@@ -344,10 +447,15 @@ class ConstrainedDecimal(Decimal, metaclass=ConstrainedNumberMeta):
 
     @classmethod
     def validate(cls, value: Decimal) -> Decimal:
-        digit_tuple, exponent = value.as_tuple()[1:]
-        if exponent in {'F', 'n', 'N'}:
+        if not value.is_finite():
             raise errors.DecimalIsNotFiniteError()
 
+        max_digits = cls.max_digits
+        decimal_places = cls.decimal_places
+        if max_digits is None and decimal_places is None:
+            return value
+
+        _, digit_tuple, exponent = value.as_tuple()
         if exponent >= 0:
             # A positive exponent adds that many trailing zeros.
             digits = len(digit_tuple) + exponent
@@ -365,14 +473,14 @@ class ConstrainedDecimal(Decimal, metaclass=ConstrainedNumberMeta):
                 decimals = abs(exponent)
         whole_digits = digits - decimals
 
-        if cls.max_digits is not None and digits > cls.max_digits:
-            raise errors.DecimalMaxDigitsError(max_digits=cls.max_digits)
+        if max_digits is not None and digits > max_digits:
+            raise errors.DecimalMaxDigitsError(max_digits=max_digits)
 
-        if cls.decimal_places is not None and decimals > cls.decimal_places:
-            raise errors.DecimalMaxPlacesError(decimal_places=cls.decimal_places)
+        if decimal_places is not None and decimals > decimal_places:
+            raise errors.DecimalMaxPlacesError(decimal_places=decimal_places)
 
-        if cls.max_digits is not None and cls.decimal_places is not None:
-            expected = cls.max_digits - cls.decimal_places
+        if max_digits is not None and decimal_places is not None:
+            expected = max_digits - decimal_places
             if whole_digits > expected:
                 raise errors.DecimalWholeDigitsError(whole_digits=expected)
 
@@ -393,7 +501,7 @@ def condecimal(
     namespace = dict(
         gt=gt, ge=ge, lt=lt, le=le, max_digits=max_digits, decimal_places=decimal_places, multiple_of=multiple_of
     )
-    return type('ConstrainedDecimalValue', (ConstrainedDecimal,), namespace)
+    return _constrained_type('ConstrainedDecimalValue', ConstrainedDecimal, namespace)
 
 
 class UUID1(UUID):
@@ -416,12 +524,11 @@ class FilePath(Path):
     @classmethod
     def __get_validators__(cls) -> 'CallableGenerator':
         yield path_validator
-        yield path_exists_validator
         yield cls.validate
 
     @classmethod
     def validate(cls, value: Path) -> Path:
-        if not value.is_file():
+        if not S_ISREG(_path_mode(value)):
             raise errors.PathNotAFileError(path=value)
 
         return value
@@ -431,17 +538,25 @@ class DirectoryPath(Path):
     @classmethod
     def __get_validators__(cls) -> 'CallableGenerator':
         yield path_validator
-        yield path_exists_validator
         yield cls.validate
 
     @classmethod
     def validate(cls, value: Path) -> Path:
-        if not value.is_dir():
+        if not S_ISDIR(_path_mode(value)):
             raise errors.PathNotADirectoryError(path=value)
 
         return value
 
 
+def _path_mode(path: Path) -> int:
+    # a single stat() serves both the "exists" check and the file or directory check
+    try:
+        return path.stat().st_mode
+    except (OSError, ValueError):
+        # doesn't exist or can't be reached, eg. a component isn't a directory or the path contains a null byte
+        raise errors.PathNotExistsError(path=path)
+
+
 class JsonWrapper:
     pass
 
@@ -456,6 +571,8 @@ class Json(metaclass=JsonMeta):
 
 
 class SecretStr:
+    __slots__ = ('_secret_value',)
+
     @classmethod
     def __get_validators__(cls) -> 'CallableGenerator':
         yield str_validator
@@ -480,8 +597,14 @@ class SecretStr:
     def get_secret_value(self) -> str:
         return self._secret_value
 
+    def __reduce__(self) -> Tuple[Type['SecretStr'], Tuple[str]]:
+        # pickle protocols 0 and 1 can't handle __slots__ by themselves
+        return self.__class__, (self._secret_value,)
+
 
 class SecretBytes:
+    __slots__ = ('_secret_value',)
+
     @classmethod
     def __get_validators__(cls) -> 'CallableGenerator':
         yield bytes_validator
@@ -506,6 +629,10 @@ class SecretBytes:
     def get_secret_value(self) -> bytes:
         return self._secret_value
 
+    def __reduce__(self) -> Tuple[Type['SecretBytes'], Tuple[bytes]]:
+        # pickle protocols 0 and 1 can't handle __slots__ by themselves
+        return self.__class__, (self._secret_value,)
+
 
 class PaymentCardBrand(Enum):
     amex = 'American Express'
@@ -517,6 +644,24 @@ class PaymentCardBrand(Enum):
         return self.value
 
 
+# brands other than visa (any number starting with 4) by the first two digits of the card number
+_BRAND_PREFIXES: Dict[str, PaymentCardBrand] = {
+    **{str(i): PaymentCardBrand.mastercard for i in range(51, 56)},
+    '34': PaymentCardBrand.amex,
+    '37': PaymentCardBrand.amex,
+}
+
+_BRAND_REQUIRED_LENGTHS: Dict[PaymentCardBrand, int] = {
+    PaymentCardBrand.amex: 15,
+    PaymentCardBrand.mastercard: 16,
+    PaymentCardBrand.visa: 16,
+}
+
+# value each digit adds to the Luhn sum indexed by its ASCII code, doubled digits over 9 have their digits summed
+_LUHN_DIGITS = bytes(c - 48 if 48 <= c <= 57 else 0 for c in range(256))
+_LUHN_DOUBLED_DIGITS = bytes(sum(divmod((c - 48) * 2, 10)) if 48 <= c <= 57 else 0 for c in range(256))
+
+
 class PaymentCardNumber(str):
     """
     Based on: https://en.wikipedia.org/wiki/Payment_card_number
@@ -525,24 +670,31 @@ class PaymentCardNumber(str):
     strip_whitespace: ClassVar[bool] = True
     min_length: ClassVar[int] = 12
     max_length: ClassVar[int] = 19
-    bin: str
-    last4: str
     brand: PaymentCardBrand
 
     def __init__(self, card_number: str):
-        self.bin = card_number[:6]
-        self.last4 = card_number[-4:]
         self.brand = self._get_brand(card_number)
 
+    @property
+    def bin(self) -> str:
+        # bin and last4 are sliced when used rather than for every card number validated
+        return self[:6]
+
+    @property
+    def last4(self) -> str:
+        return self[-4:]
+
     @classmethod
     def __get_validators__(cls) -> 'CallableGenerator':
         yield str_validator
-        yield constr_strip_whitespace
-        yield constr_length_validator
-        yield cls.validate_digits
-        yield cls.validate_luhn_check_digit
-        yield cls
-        yield cls.validate_length_for_brand
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value: str, field: 'Field', config: 'BaseConfig') -> 'PaymentCardNumber':
+        # the steps are called directly rather than yielded one by one, which would cost a generic validator call each
+        card_number = constr_length_validator(constr_strip_whitespace(value, field, config), field, config)
+        card_number = cls.validate_luhn_check_digit(cls.validate_digits(card_number))  # type: ignore
+        return cls.validate_length_for_brand(cls(card_number))
 
     @property
     def masked(self) -> str:
@@ -551,7 +703,12 @@ class PaymentCardNumber(str):
 
     @classmethod
     def validate_digits(cls, card_number: str) -> str:
-        if not card_number.isdigit():
+        # str.isdigit() also accepts non-ASCII digits (eg. '٣' or '²'), bytes.isdigit() only accepts 0-9
+        try:
+            valid = card_number.encode('ascii').isdigit()
+        except UnicodeEncodeError:
+            valid = False
+        if not valid:
             raise errors.NotDigitError
         return card_number
 
@@ -559,17 +716,16 @@ class PaymentCardNumber(str):
     def validate_luhn_check_digit(cls, card_number: str) -> str:
         """
         Based on: https://en.wikipedia.org/wiki/Luhn_algorithm
+
+        Working from the check digit leftwards every second digit is doubled, each digit's contribution is looked up
+        from its ASCII code so the sums happen in C rather than a loop here.
         """
-        sum_ = int(card_number[-1])
-        length = len(card_number)
-        parity = length % 2
-        for i in range(length - 1):
-            digit = int(card_number[i])
-            if i % 2 == parity:
-                digit *= 2
-            sum_ += digit
-        valid = sum_ % 10 == 0
-        if not valid:
+        try:
+            digits = card_number.encode('ascii')
+        except UnicodeEncodeError:
+            raise errors.LuhnValidationError
+        sum_ = sum(digits[-1::-2].translate(_LUHN_DIGITS)) + sum(digits[-2::-2].translate(_LUHN_DOUBLED_DIGITS))
+        if sum_ % 10:
             raise errors.LuhnValidationError
         return card_number
 
@@ -579,27 +735,13 @@ class PaymentCardNumber(str):
         Validate length based on BIN for major brands:
         https://en.wikipedia.org/wiki/Payment_card_number#Issuer_identification_number_(IIN)
         """
-        required_length: Optional[int] = None
-        if card_number.brand is (PaymentCardBrand.visa or PaymentCardBrand.mastercard):
-            required_length = 16
-            valid = len(card_number) == required_length
-        elif card_number.brand is PaymentCardBrand.amex:
-            required_length = 15
-            valid = len(card_number) == required_length
-        else:
-            valid = True
-        if not valid:
+        required_length = _BRAND_REQUIRED_LENGTHS.get(card_number.brand)
+        if required_length is not None and len(card_number) != required_length:
             raise errors.InvalidLengthForBrand(brand=card_number.brand, required_length=required_length)
         return card_number
 
     @staticmethod
     def _get_brand(card_number: str) -> PaymentCardBrand:
         if card_number[0] == '4':
-            brand = PaymentCardBrand.visa
-        elif 51 <= int(card_number[:2]) <= 55:
-            brand = PaymentCardBrand.mastercard
-        elif card_number[:2] in {'34', '37'}:
-            brand = PaymentCardBrand.amex
-        else:
-            brand = PaymentCardBrand.other
-        return brand
+            return PaymentCardBrand.visa
+        return _BRAND_PREFIXES.get(card_number[:2], PaymentCardBrand.other)
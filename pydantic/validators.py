@@ -476,6 +476,45 @@ class IfConfig:
         return any(getattr(config, name) not in {None, False} for name in self.config_attr_names)
 
 
+def _number_size_noop(field: 'Field', config: Type['BaseConfig']) -> bool:
+    field_type: ConstrainedNumber = field.type_  # type: ignore
+    return field_type.gt is None and field_type.ge is None and field_type.lt is None and field_type.le is None
+
+
+def _number_multiple_noop(field: 'Field', config: Type['BaseConfig']) -> bool:
+    return field.type_.multiple_of is None  # type: ignore
+
+
+def _constr_length_noop(field: 'Field', config: Type['BaseConfig']) -> bool:
+    return (field.type_.min_length or config.min_anystr_length) is None and (  # type: ignore
+        field.type_.max_length or config.max_anystr_length  # type: ignore
+    ) is None
+
+
+def _constr_strip_whitespace_noop(field: 'Field', config: Type['BaseConfig']) -> bool:
+    return not (field.type_.strip_whitespace or config.anystr_strip_whitespace)  # type: ignore
+
+
+# validators which may do nothing depending on the field's type and config, paired with a check for that case
+_NOOP_CHECKS: List[Tuple[AnyCallable, Callable[['Field', Type['BaseConfig']], bool]]] = [
+    (number_size_validator, _number_size_noop),
+    (number_multiple_validator, _number_multiple_noop),
+    (constr_length_validator, _constr_length_noop),
+    (constr_strip_whitespace, _constr_strip_whitespace_noop),
+]
+
+
+def is_noop_validator(validator: AnyCallable, field: 'Field', config: Type['BaseConfig']) -> bool:
+    """
+    Whether validator would return every value unchanged for this field and config, so can be left out of its
+    validators entirely, eg. constr_length_validator when there are no length limits.
+    """
+    for v, check in _NOOP_CHECKS:
+        if validator is v:
+            return check(field, config)
+    return False
+
+
 pattern_validators = [str_validator, pattern_validator]
 # order is important here, for example: bool is a subclass of int so has to come first, datetime before date same,
 # IPv4Interface before IPv4Address, etc
@@ -18,6 +18,7 @@ from pydantic import (
     validate_model,
     validator,
 )
+from pydantic.fields import Field
 
 
 def test_str_bytes():
@@ -106,6 +107,49 @@ def test_typed_list():
     assert exc_info.value.errors() == [{'loc': ('v',), 'msg': 'value is not a valid list', 'type': 'type_error.list'}]
 
 
+def test_field_subclass_shape_validator():
+    class MyField(Field):
+        __slots__ = ()
+
+        def _validate_sequence_like(self, v, values, loc, cls):
+            return 'overridden', None
+
+    field = MyField(name='a', type_=List[int], class_validators=None, model_config=BaseConfig)
+    assert field.validate([1], {}, loc='a') == ('overridden', None)
+    assert field.sub_fields[0].__class__ is MyField
+
+
+def test_typed_containers_exact_items():
+    class Model(BaseModel):
+        a: List[int]
+        b: Set[float]
+        c: Dict[str, int]
+        d: Tuple[str, ...]
+
+    a, c = [1, 2, 3], {'x': 1, 'y': 2}
+    m = Model(a=a, b=[1.5, 2.5], c=c, d=['x', 'y'])
+    assert m.a == [1, 2, 3]
+    assert m.a is not a
+    assert m.b == {1.5, 2.5}
+    assert m.c == {'x': 1, 'y': 2}
+    assert m.c is not c
+    assert m.d == ('x', 'y')
+
+    # containers with any item not of the exact type are validated item by item
+    m = Model(a=[1, True, '3'], b={1, 2.5}, c={'x': 1, 'y': '2', 3: 3}, d=['x', b'y'])
+    assert m.a == [1, 1, 3]
+    assert m.b == {1.0, 2.5}
+    assert all(type(v) is float for v in m.b)
+    assert m.c == {'x': 1, 'y': 2, '3': 3}
+    assert m.d == ('x', 'y')
+
+    with pytest.raises(ValidationError) as exc_info:
+        Model(a=[1, None], b=[], c={}, d=[])
+    assert exc_info.value.errors() == [
+        {'loc': ('a', 1), 'msg': 'none is not an allowed value', 'type': 'type_error.none.not_allowed'}
+    ]
+
+
 def test_typed_set():
     class Model(BaseModel):
         v: Set[int] = ...
@@ -419,3 +419,23 @@ Owner.update_forward_refs()
             },
         },
     }
+
+
+def test_unresolved_forward_ref_sub_fields(create_module):
+    module = create_module(
+        """
+from typing import Dict, List, Union
+from pydantic import BaseConfig, BaseModel
+from pydantic.fields import Field
+from pydantic.typing import ForwardRef
+
+class Foo(BaseModel):
+    a: Union[int, ForwardRef('Bar')] = None
+
+list_field = Field(name='b', type_=List[ForwardRef('Bar')], class_validators=None, model_config=BaseConfig)
+dict_field = Field(name='c', type_=Dict[str, ForwardRef('Bar')], class_validators=None, model_config=BaseConfig)
+    """
+    )
+    assert module.Foo(a='x').dict() == {'a': 'x'}
+    assert module.list_field.validate(['x'], {}, loc='b') == (['x'], None)
+    assert module.dict_field.validate({'k': 'x'}, {}, loc='c') == ({'k': 'x'}, None)
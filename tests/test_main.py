@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Any, ClassVar, List, Mapping, Type
+from typing import Any, ClassVar, Dict, List, Mapping, Tuple, Type, Union
 
 import pytest
 
@@ -589,6 +589,23 @@ def test_default_copy():
     assert u1.friends is not u2.friends
 
 
+def test_default_eq_not_called():
+    class Unequal:
+        def __eq__(self, other):
+            raise TypeError('no comparison')
+
+    default = Unequal()
+
+    class Model(BaseModel):
+        x: Unequal = default
+
+        class Config:
+            arbitrary_types_allowed = True
+
+    assert Model.__fields__['x'].required is False
+    assert isinstance(Model().x, Unequal)
+
+
 class ArbitraryType:
     pass
 
@@ -636,6 +653,19 @@ def test_arbitrary_types_not_allowed():
     assert exc_info.value.args[0].startswith('no validator found for')
 
 
+@pytest.mark.parametrize(
+    'type_', [List[ArbitraryType], Dict[str, ArbitraryType], Tuple[int, ArbitraryType], Union[int, ArbitraryType]]
+)
+def test_nested_arbitrary_types_not_allowed(type_):
+    # sub fields are built with the model, so errors for nested types are raised at class definition too
+    with pytest.raises(RuntimeError) as exc_info:
+
+        class ArbitraryTypeNotAllowedModel(BaseModel):
+            t: type_
+
+    assert exc_info.value.args[0].startswith('no validator found for')
+
+
 def test_type_type_validation_success():
     class ArbitraryClassAllowedModel(BaseModel):
         t: Type[ArbitraryType]
@@ -1,4 +1,6 @@
+import copy
 import os
+import pickle
 import sys
 import uuid
 from collections import OrderedDict
@@ -6,7 +8,7 @@ from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 from enum import Enum, IntEnum
 from pathlib import Path
-from typing import Dict, FrozenSet, Iterator, List, MutableSet, NewType, Pattern, Sequence, Set, Tuple
+from typing import Dict, FrozenSet, Iterator, List, MutableSet, NewType, Optional, Pattern, Sequence, Set, Tuple
 from uuid import UUID
 
 import pytest
@@ -18,6 +20,8 @@ from pydantic import (
     UUID5,
     BaseModel,
     ConfigError,
+    ConstrainedList,
+    ConstrainedStr,
     DirectoryPath,
     EmailStr,
     FilePath,
@@ -93,6 +97,47 @@ def test_constrained_list_good():
 
     m = ConListModelMax(v=[1, 2, 3])
     assert m.v == [1, 2, 3]
+    # without min_items or max_items there's nothing to check
+    assert ConListModelMax.__fields__['v'].pre_validators is None
+
+
+@pytest.mark.parametrize('min_items', [None, 1])
+def test_constrained_list_not_a_list(min_items):
+    class Model(BaseModel):
+        v: conlist(int, min_items=min_items)
+        o: Optional[conlist(int, min_items=min_items)]
+
+    assert Model(v=(str(i) for i in range(3))).v == [0, 1, 2]
+    assert Model(v=[1], o=None).o is None
+    with pytest.raises(ValidationError) as exc_info:
+        Model(v=None)
+    assert exc_info.value.errors() == [
+        {'loc': ('v',), 'msg': 'none is not an allowed value', 'type': 'type_error.none.not_allowed'}
+    ]
+    for value in (1, Decimal(1)):
+        with pytest.raises(ValidationError) as exc_info:
+            Model(v=value)
+        assert exc_info.value.errors() == [
+            {'loc': ('v',), 'msg': 'value is not a valid list', 'type': 'type_error.list'}
+        ]
+
+
+def test_constrained_list_length_validator_staticmethod():
+    class NonEmptyList(ConstrainedList):
+        item_type = int
+        __args__ = (int,)
+
+        @staticmethod
+        def list_length_validator(v):
+            assert v, 'empty'
+            return v
+
+    class Model(BaseModel):
+        v: NonEmptyList
+
+    assert Model(v=[1]).v == [1]
+    with pytest.raises(ValidationError):
+        Model(v=[])
 
 
 def test_constrained_list_default():
@@ -208,6 +253,141 @@ def test_constrained_str_too_long():
     ]
 
 
+def test_constrained_str_noop_validators():
+    class Model(BaseModel):
+        a: constr() = ...
+        b: constr(max_length=3) = ...
+        c: conint() = ...
+
+    fields = Model.__fields__
+    assert [v.__name__ for v in fields['a'].validators] == ['str_validator']
+    assert [v.__name__ for v in fields['b'].validators] == ['str_validator', 'constr_length_validator']
+    assert [v.__name__ for v in fields['c'].validators] == ['int_validator']
+
+    class SubModel(Model):
+        class Config:
+            anystr_strip_whitespace = True
+            max_anystr_length = 5
+
+    assert [v.__name__ for v in SubModel.__fields__['a'].validators] == [
+        'str_validator',
+        'constr_strip_whitespace',
+        'constr_length_validator',
+    ]
+    assert Model(a=' abcdef ', b='abc', c=1).a == ' abcdef '
+    assert SubModel(a=' abc ', b='abc', c=1).a == 'abc'
+    with pytest.raises(ValidationError) as exc_info:
+        SubModel(a='abcdef', b='abc', c=1)
+    assert exc_info.value.errors() == [
+        {
+            'loc': ('a',),
+            'msg': 'ensure this value has at most 5 characters',
+            'type': 'value_error.any_str.max_length',
+            'ctx': {'limit_value': 5},
+        }
+    ]
+
+
+def test_constrained_str_noop_validators_inherited():
+    class Parent(BaseModel):
+        a: str
+        b: constr()
+        c: List[constr()] = []
+
+    class Child(Parent):
+        class Config:
+            anystr_strip_whitespace = True
+            max_anystr_length = 3
+
+    # constr's own validators follow the child's config, validators picked for str and items of sub fields
+    # keep the parent's
+    assert Child(a=' x ', b=' y ', c=[' z ']).dict() == {'a': ' x ', 'b': 'y', 'c': [' z ']}
+    assert Child(a='xxxxx', b='y', c=['zzzzz']).a == 'xxxxx'
+    with pytest.raises(ValidationError) as exc_info:
+        Child(a='x', b='yyyyy')
+    assert exc_info.value.errors()[0]['loc'] == ('b',)
+
+
+def test_constrained_str_validate_overridden():
+    class UpperStr(ConstrainedStr):
+        @classmethod
+        def validate(cls, value):
+            return value.upper()
+
+    class Model(BaseModel):
+        a: UpperStr
+        b: constr(curtail_length=3)
+
+    assert [v.__name__ for v in Model.__fields__['a'].validators] == ['str_validator', 'validate']
+    assert [v.__name__ for v in Model.__fields__['b'].validators] == ['str_validator', 'curtail_validator']
+    assert Model(a='abc', b='abcdef').dict() == {'a': 'ABC', 'b': 'abc'}
+
+
+def test_constrained_str_validate_staticmethod():
+    class ExclaimStr(ConstrainedStr):
+        @staticmethod
+        def validate(value):
+            return value + '!'
+
+    class Model(BaseModel):
+        a: ExclaimStr
+
+    assert Model(a='x').a == 'x!'
+
+
+@pytest.mark.parametrize(
+    'regex,value,valid',
+    [
+        ('foo', 'foobar', True),
+        ('^foo', 'foobar', True),
+        ('foo', 'barfoo', False),
+        ('^foo_bar', 'foo_bar1', True),
+        ('^foo_bar', 'foo-bar', False),
+        ('.*', '', True),
+        ('^.*', 'anything\n', True),
+        ('^foo.*', 'foobar', True),
+        ('^foo.*', 'fo', False),
+        ('(?i)foo', 'FOO', True),
+    ],
+)
+def test_constr_regex_shortcuts(regex, value, valid):
+    class Model(BaseModel):
+        v: constr(regex=regex)
+
+    if valid:
+        assert Model(v=value).v == value
+    else:
+        with pytest.raises(ValidationError) as exc_info:
+            Model(v=value)
+        assert exc_info.value.errors()[0]['ctx'] == {'pattern': regex}
+
+
+def test_constrained_types_cached():
+    assert constr(max_length=5) is constr(max_length=5)
+    assert constr(max_length=5) is not constr(max_length=6)
+    assert conint(gt=1) is conint(gt=1)
+    assert conint(gt=1) is not conint(gt=True)
+    assert confloat(gt=1) is not confloat(gt=1.0)
+    assert conlist(int, min_items=1) is conlist(int, min_items=1)
+    assert conlist(int) is not conlist(str)
+    assert conbytes() is conbytes()
+    assert condecimal(max_digits=3) is condecimal(max_digits=3)
+    assert constr().__module__ == conlist(int).__module__ == 'pydantic.types'
+
+
+def test_constrained_types_cache_bounded(monkeypatch):
+    cache = OrderedDict()
+    monkeypatch.setattr('pydantic.types._CONSTRAINED_TYPES_CACHE_SIZE', 2)
+    monkeypatch.setattr('pydantic.types._constrained_types_cache', cache)
+    first, second = conint(gt=1), conint(gt=2)
+    assert conint(gt=1) is first
+    conint(gt=3)
+    # the least recently used class was dropped
+    assert len(cache) == 2
+    assert conint(gt=1) is first
+    assert conint(gt=2) is not second
+
+
 def test_module_import():
     class PyObjectModel(BaseModel):
         module: PyObject = 'os.path'
@@ -1736,6 +1916,15 @@ def test_secretbytes_error():
     assert exc_info.value.errors() == [{'loc': ('password',), 'msg': 'byte type expected', 'type': 'type_error.bytes'}]
 
 
+@pytest.mark.parametrize('protocol', range(pickle.HIGHEST_PROTOCOL + 1))
+@pytest.mark.parametrize('secret', [SecretStr('abc'), SecretBytes(b'abc')])
+def test_secret_pickle(secret, protocol):
+    loaded = pickle.loads(pickle.dumps(secret, protocol))
+    assert type(loaded) is type(secret)
+    assert loaded.get_secret_value() == secret.get_secret_value()
+    assert copy.deepcopy(secret).get_secret_value() == secret.get_secret_value()
+
+
 def test_generic_without_params():
     class Model(BaseModel):
         generic_list: List
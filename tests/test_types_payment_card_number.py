@@ -28,6 +28,10 @@ def test_validate_digits():
     assert PaymentCardNumber.validate_digits(digits) == digits
     with pytest.raises(NotDigitError):
         PaymentCardNumber.validate_digits('hello')
+    with pytest.raises(NotDigitError):
+        PaymentCardNumber.validate_digits('١٢٣٤٥')
+    with pytest.raises(NotDigitError):
+        PaymentCardNumber.validate_digits('1234²')
 
 
 def test_validate_luhn_check_digit():
@@ -36,6 +40,29 @@ def test_validate_luhn_check_digit():
         PaymentCardNumber.validate_luhn_check_digit(LUHN_INVALID)
 
 
+@pytest.mark.parametrize(
+    'card_number, valid',
+    [
+        (VALID_AMEX, True),
+        (VALID_VISA, True),
+        (VALID_OTHER, True),
+        ('5555555555554444', True),
+        ('378282246310005', True),
+        ('6011111111111117', True),
+        ('79927398713', True),
+        ('79927398710', False),
+        ('5555555555554445', False),
+        (LUHN_INVALID, False),
+    ],
+)
+def test_luhn_doubled_digits(card_number: str, valid: bool):
+    if valid:
+        assert PaymentCardNumber.validate_luhn_check_digit(card_number) == card_number
+    else:
+        with pytest.raises(LuhnValidationError):
+            PaymentCardNumber.validate_luhn_check_digit(card_number)
+
+
 @pytest.mark.parametrize(
     'card_number, brand, valid',
     [
@@ -44,6 +71,8 @@ def test_validate_luhn_check_digit():
         (VALID_AMEX, PaymentCardBrand.amex, True),
         (VALID_OTHER, PaymentCardBrand.other, True),
         (LEN_INVALID, PaymentCardBrand.visa, False),
+        ('51000000000000003', PaymentCardBrand.mastercard, False),
+        ('3700000000000002', PaymentCardBrand.amex, False),
     ],
 )
 def test_length_for_brand(card_number: str, brand: PaymentCardBrand, valid: bool):
@@ -62,6 +91,10 @@ def test_length_for_brand(card_number: str, brand: PaymentCardBrand, valid: bool
         (VALID_MC, PaymentCardBrand.mastercard),
         (VALID_VISA, PaymentCardBrand.visa),
         (VALID_OTHER, PaymentCardBrand.other),
+        ('340000000000000', PaymentCardBrand.amex),
+        ('5500000000000000', PaymentCardBrand.mastercard),
+        ('5000000000000000', PaymentCardBrand.other),
+        ('5600000000000000', PaymentCardBrand.other),
     ],
 )
 def test_get_brand(card_number: str, brand: PaymentCardBrand):
@@ -72,6 +105,9 @@ def test_valid():
     card = PaymentCard(card_number=VALID_VISA)
     assert str(card.card_number) == VALID_VISA
     assert card.card_number.masked == '400000******0002'
+    assert card.card_number.bin == '400000'
+    assert card.card_number.last4 == '0002'
+    assert card.card_number.brand is PaymentCardBrand.visa
 
 
 @pytest.mark.parametrize(
@@ -670,6 +670,15 @@ def test_make_generic_validator_self():
     assert ': (self, v), "self" not permitted as first argument, should be: (cls, value' in str(exc_info.value)
 
 
+def test_make_generic_validator_cached():
+    def test_validator(v, values):
+        return v
+
+    validator = make_generic_validator(test_validator)
+    assert make_generic_validator(test_validator) is validator
+    assert validator('_cls_', '_v_', '_vs_', '_f_', '_c_') == '_v_'
+
+
 def test_assert_raises_validation_error():
     class Model(BaseModel):
         a: str